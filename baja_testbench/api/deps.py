@@ -2,11 +2,42 @@
 FastAPI dependencies for dependency injection.
 """
 
-from baja_testbench.services.system_metrics import SystemMetricsService
+import secrets
+from typing import Optional
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from baja_testbench.core.config import settings
+from baja_testbench.services.profiler import SamplingProfiler
+from modules.health_check.service import HealthCheckModule
 
 
-def get_metrics_service() -> SystemMetricsService:
-    """Dependency to get system metrics service instance."""
-    return SystemMetricsService()
+def get_health_module(request: Request) -> HealthCheckModule:
+    """Dependency to get the application's shared health check module."""
+    return request.app.state.health_module
 
 
+def get_profiler() -> SamplingProfiler:
+    """Dependency to get sampling profiler instance."""
+    return SamplingProfiler()
+
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+def require_diagnostics_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+) -> None:
+    """Dependency guarding diagnostics routes with the configured bearer token."""
+    if not settings.diagnostics_token:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Diagnostics are disabled (diagnostics_token not configured)",
+        )
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(), settings.diagnostics_token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing diagnostics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
@@ -0,0 +1,53 @@
+"""
+Diagnostics API endpoints.
+"""
+
+import asyncio
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+from baja_testbench.core.config import settings
+from baja_testbench.services.profiler import ProfilerBusyError, SamplingProfiler
+from baja_testbench.api.deps import get_profiler, require_diagnostics_token
+
+router = APIRouter(
+    prefix="/diagnostics",
+    dependencies=[Depends(require_diagnostics_token)],
+)
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def get_profile(
+    seconds: float = Query(10.0, gt=0, le=settings.profiler_max_seconds),
+    hz: Optional[float] = Query(None, gt=0, le=settings.profiler_max_hz),
+    profiler: SamplingProfiler = Depends(get_profiler),
+) -> PlainTextResponse:
+    """
+    Runs a statistical profile of the live server for `seconds`.
+    
+    Returns stacks in collapsed format ("frame;frame;frame count" per line),
+    ready for flamegraph.pl or speedscope. The sample rate is lowered as
+    needed to keep the sampler within profiler_max_overhead_percent.
+    Sample count, duration, effective rate and measured sampler overhead
+    are returned in X-Profile-* headers. The overhead figure counts only
+    the sampler thread's CPU time, not GIL waits it causes elsewhere.
+    """
+    try:
+        collapsed, stats = await asyncio.to_thread(
+            profiler.profile,
+            seconds,
+            hz or settings.profiler_default_hz,
+            settings.profiler_max_overhead_percent,
+        )
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    return PlainTextResponse(
+        collapsed,
+        headers={
+            "X-Profile-Samples": str(stats["samples"]),
+            "X-Profile-Duration": str(stats["duration_seconds"]),
+            "X-Profile-Effective-Hz": str(stats["effective_hz"]),
+            "X-Profile-Overhead-Percent": str(stats["overhead_percent"]),
+        },
+    )
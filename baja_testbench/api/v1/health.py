@@ -4,15 +4,15 @@ Health check API endpoints.
 
 from fastapi import APIRouter, Depends
 from baja_testbench.models.health import HealthResponse
-from baja_testbench.services.system_metrics import SystemMetricsService
-from baja_testbench.api.deps import get_metrics_service
+from baja_testbench.api.deps import get_health_module
+from modules.health_check.service import HealthCheckModule
 
 router = APIRouter()
 
 
 @router.get("/health", response_model=HealthResponse)
 async def get_health(
-    metrics_service: SystemMetricsService = Depends(get_metrics_service)
+    health_module: HealthCheckModule = Depends(get_health_module),
 ) -> HealthResponse:
     """
     Returns comprehensive system health metrics.
@@ -24,8 +24,10 @@ async def get_health(
     - Voltage/throttling status (Raspberry Pi specific)
     - Network statistics
     - Disk usage and I/O
+    - Overall status from the health rule engine
+    
+    Served from the latest sampler tick so metrics and status agree.
     """
-    metrics = metrics_service.get_all_metrics()
-    return HealthResponse(**metrics)
+    return HealthResponse(**health_module.get_health_status())
 
 
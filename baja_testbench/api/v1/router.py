@@ -3,10 +3,11 @@ API v1 router aggregation.
 """
 
 from fastapi import APIRouter
-from baja_testbench.api.v1 import health
+from baja_testbench.api.v1 import health, diagnostics
 
 api_router = APIRouter()
 
 api_router.include_router(health.router, tags=["health"])
+api_router.include_router(diagnostics.router, tags=["diagnostics"])
 
 
@@ -3,6 +3,7 @@ Application configuration using Pydantic Settings.
 Supports environment variables and .env files.
 """
 
+from pydantic import Field
 from pydantic_settings import BaseSettings
 from typing import List, Optional
 
@@ -31,6 +32,16 @@ class Settings(BaseSettings):
     
     # Health Check
     health_check_timeout: int = 2  # seconds for subprocess timeouts
+    health_sample_interval: float = 2.0  # seconds between sampler ticks
+    health_rules_path: Optional[str] = None  # JSON rules file; built-in defaults if unset
+    health_subscriber_queue_size: int = 32  # metric payloads buffered per client
+    
+    # Diagnostics
+    diagnostics_token: Optional[str] = None  # bearer token; diagnostics routes disabled if unset
+    profiler_default_hz: float = 50.0
+    profiler_max_hz: float = 100.0
+    profiler_max_seconds: float = 60.0
+    profiler_max_overhead_percent: float = Field(1.5, gt=0)  # sampler CPU budget; interval stretches to stay under it
     
     class Config:
         env_file = ".env"
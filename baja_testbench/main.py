@@ -7,10 +7,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 import asyncio
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from baja_testbench.core.config import settings
 from baja_testbench.api.v1.router import api_router
-from baja_testbench.services.system_metrics import SystemMetricsService
+from modules.health_check.service import HealthCheckModule
 
 
 def create_application() -> FastAPI:
@@ -18,12 +19,29 @@ def create_application() -> FastAPI:
     Application factory pattern for FastAPI.
     Allows for easier testing and configuration.
     """
+    health_module = HealthCheckModule()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Single sampler shared by all clients so rule state is consistent
+        sampler = asyncio.create_task(
+            health_module.run_sampler(settings.health_sample_interval)
+        )
+        try:
+            yield
+        finally:
+            sampler.cancel()
+            with suppress(asyncio.CancelledError):
+                await sampler
+
     app = FastAPI(
         title=settings.app_name,
         description="Hardware-in-the-Loop test server for drivetrain subsystem validation",
         version=settings.app_version,
         debug=settings.debug,
+        lifespan=lifespan,
     )
+    app.state.health_module = health_module
     
     app.add_middleware(
         CORSMiddleware,
@@ -51,6 +69,7 @@ def create_application() -> FastAPI:
             "version": settings.app_version,
             "endpoints": {
                 f"{settings.api_v1_prefix}/health": "System health diagnostics",
+                f"{settings.api_v1_prefix}/diagnostics/profile": "Sampling profiler (token required)",
                 "/docs": "API documentation (Swagger UI)",
                 "/redoc": "Alternative API documentation"
             }
@@ -58,24 +77,26 @@ def create_application() -> FastAPI:
     
     @app.websocket("/ws/system-stream")
     async def websocket_health_stream(websocket: WebSocket):
-        """WebSocket endpoint for streaming system health data."""
+        """
+        WebSocket endpoint for streaming system health data.
+        Relays sampler ticks and health transition events.
+        """
         await websocket.accept()
-        metrics_service = SystemMetricsService()
+        subscription = health_module.subscribe()
         
         try:
+            if health_module.latest is not None:
+                await websocket.send_json(health_module.latest)
             while True:
-                # Get current health metrics
-                metrics = metrics_service.get_all_metrics()
-                
-                await websocket.send_json(metrics)
-                
-                # Wait 2 seconds before next update
-                await asyncio.sleep(2)
+                message = await subscription.get()
+                await websocket.send_json(message)
         except WebSocketDisconnect:
             print("WebSocket client disconnected")
         except Exception as e:
             print(f"WebSocket error: {e}")
             await websocket.close()
+        finally:
+            health_module.unsubscribe(subscription)
     
     return app
 
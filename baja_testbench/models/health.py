@@ -3,7 +3,7 @@ Pydantic models for health check endpoints.
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Literal
 
 
 class SystemInfo(BaseModel):
@@ -99,5 +99,6 @@ class HealthResponse(BaseModel):
     voltage: VoltageInfo
     network: NetworkInfo
     disk: DiskInfo
+    health_status: Optional[Literal["healthy", "degraded", "unhealthy"]] = None
 
 
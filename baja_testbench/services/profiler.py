@@ -0,0 +1,121 @@
+"""
+Service for on-demand statistical profiling of the running server.
+Samples every thread's stack from a background thread and aggregates
+the result into collapsed (flamegraph) format.
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import CodeType
+from typing import Dict, Tuple
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+class SamplingProfiler:
+    """
+    Low-overhead sampling profiler.
+    No thread exists until a profile is requested, so idle cost is zero.
+    """
+
+    # Only one profile may run at a time across the process
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _label(code: CodeType) -> str:
+        path = Path(code.co_filename)
+        name = getattr(code, "co_qualname", code.co_name)
+        return f"{name} ({path.parent.name}/{path.name})"
+
+    @staticmethod
+    def _sample(counts: Counter, own_ident: int) -> None:
+        # Hot path: count raw code-object stacks, leaf first. Labels and
+        # collapsed strings are built once, after sampling ends.
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            codes = []
+            append = codes.append
+            while frame is not None:
+                append(frame.f_code)
+                frame = frame.f_back
+            counts[(ident, tuple(codes))] += 1
+
+    def _collapse(self, counts: Counter) -> str:
+        thread_names = {t.ident: t.name for t in threading.enumerate()}
+        labels: Dict[CodeType, str] = {}
+        collapsed: Counter = Counter()
+        for (ident, codes), count in counts.items():
+            stack = [thread_names.get(ident, f"thread-{ident}")]
+            for code in reversed(codes):
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = self._label(code)
+                stack.append(label)
+            collapsed[";".join(stack)] += count
+        return "\n".join(f"{stack} {count}" for stack, count in collapsed.most_common())
+
+    def profile(
+        self, seconds: float, hz: float, max_overhead_percent: float = 1.5
+    ) -> Tuple[str, Dict[str, float]]:
+        """
+        Sample all other threads at up to `hz` for `seconds`.
+        Blocks the calling thread, so run it off the event loop.
+        Returns collapsed stacks and run statistics.
+
+        The sampling interval is stretched whenever the sampler's own CPU
+        time would exceed `max_overhead_percent` of wall time. That figure
+        (also reported as `overhead_percent`) only counts this thread's
+        CPU time; it does not include time other threads spend waiting on
+        the GIL while a sample is taken, so the real cost is somewhat higher.
+        """
+        if seconds <= 0 or hz <= 0 or max_overhead_percent <= 0:
+            raise ValueError("seconds, hz and max_overhead_percent must be positive")
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profile is already running")
+
+        try:
+            counts: Counter = Counter()
+            own_ident = threading.get_ident()
+            interval = 1.0 / hz
+            budget = max_overhead_percent / 100.0
+            start = time.perf_counter()
+            cpu_start = time.thread_time()
+            deadline = start + seconds
+            next_tick = start
+            samples = 0
+            while True:
+                now = time.perf_counter()
+                if now >= deadline:
+                    break
+                if now < next_tick:
+                    # Never sleep past the deadline; re-check both on wake
+                    time.sleep(min(next_tick, deadline) - now)
+                    continue
+                self._sample(counts, own_ident)
+                samples += 1
+                # Never schedule earlier than the CPU budget allows, and
+                # skip missed ticks rather than bursting to catch up
+                cpu_used = time.thread_time() - cpu_start
+                next_tick = max(
+                    next_tick + interval,
+                    start + cpu_used / budget,
+                    time.perf_counter(),
+                )
+            elapsed = time.perf_counter() - start
+            cpu_used = time.thread_time() - cpu_start
+        finally:
+            self._lock.release()
+
+        stats = {
+            "samples": samples,
+            "duration_seconds": round(elapsed, 3),
+            "effective_hz": round(samples / elapsed, 1) if elapsed > 0 else 0.0,
+            "overhead_percent": round(100.0 * cpu_used / elapsed, 3) if elapsed > 0 else 0.0,
+        }
+        return self._collapse(counts), stats
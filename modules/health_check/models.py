@@ -3,13 +3,43 @@ Health Check Module Models
 Module-specific data models.
 """
 
-from pydantic import BaseModel
-from typing import Literal
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
 
 
-class HealthStatus(BaseModel):
-    """Health status assessment."""
-    status: Literal["healthy", "degraded", "unhealthy"]
+class RuleThreshold(BaseModel):
+    """
+    Enter/exit pair for a single severity level.
+    `exit` defaults to `enter`, i.e. no hysteresis band.
+    Sustain/clear durations override the rule-level values when set.
+    """
+    enter: float
+    exit: Optional[float] = None
+    sustain_seconds: Optional[float] = Field(None, ge=0)
+    clear_seconds: Optional[float] = Field(None, ge=0)
+
+
+class HealthRule(BaseModel):
+    """Configuration for a single streaming health rule."""
+    name: str
+    metric: str  # dotted path into the metrics dict, e.g. "temperature.celsius"
+    aggregate: Literal["value", "ewma", "max", "min", "rate"] = "value"
+    window_seconds: float = Field(0.0, ge=0)
+    direction: Literal["above", "below"] = "above"
+    degraded: Optional[RuleThreshold] = None
+    unhealthy: Optional[RuleThreshold] = None
+    sustain_seconds: float = Field(0.0, ge=0)  # condition must hold this long to raise
+    clear_seconds: float = Field(0.0, ge=0)  # condition must be clear this long to drop
     message: str = ""
 
 
+class HealthTransition(BaseModel):
+    """State transition event pushed to clients."""
+    type: Literal["health_event"] = "health_event"
+    rule: str
+    previous: Literal["healthy", "degraded", "unhealthy"]
+    current: Literal["healthy", "degraded", "unhealthy"]
+    value: Optional[float] = None
+    overall: Literal["healthy", "degraded", "unhealthy"]
+    message: str = ""
+    timestamp: float
@@ -0,0 +1,326 @@
+"""
+Health Check Module Rules
+Streaming rule engine evaluated on every sampler tick.
+
+Each rule reads one metric, folds it into a rolling aggregate with O(1)
+(amortized) work per sample, and drives a hysteretic latch per severity
+level. Rules are compiled once at load time.
+"""
+
+import json
+import math
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from modules.health_check.models import HealthRule, HealthTransition, RuleThreshold
+
+
+HEALTHY = "healthy"
+DEGRADED = "degraded"
+UNHEALTHY = "unhealthy"
+
+LEVELS = (HEALTHY, DEGRADED, UNHEALTHY)
+
+
+# Default rules, used when no rules file is configured.
+DEFAULT_RULES: List[Dict[str, Any]] = [
+    {
+        "name": "cpu_temperature",
+        "metric": "temperature.celsius",
+        "aggregate": "ewma",
+        "window_seconds": 10,
+        "degraded": {"enter": 80, "exit": 75},
+        "unhealthy": {"enter": 85, "exit": 80},
+        "sustain_seconds": 4,
+        "clear_seconds": 10,
+        "message": "CPU temperature high",
+    },
+    {
+        "name": "cpu_temperature_rise",
+        "metric": "temperature.celsius",
+        "aggregate": "rate",
+        "window_seconds": 30,
+        "degraded": {"enter": 0.5, "exit": 0.2},
+        "sustain_seconds": 10,
+        "clear_seconds": 10,
+        "message": "CPU temperature rising quickly",
+    },
+    {
+        "name": "cpu_usage",
+        "metric": "cpu.usage_percent",
+        "aggregate": "ewma",
+        "window_seconds": 10,
+        "degraded": {"enter": 95, "exit": 85},
+        "sustain_seconds": 10,
+        "clear_seconds": 10,
+        "message": "CPU saturated",
+    },
+    {
+        "name": "memory_usage",
+        "metric": "memory.percent",
+        "aggregate": "max",
+        "window_seconds": 10,
+        "degraded": {"enter": 95, "exit": 90},
+        "unhealthy": {"enter": 98, "exit": 95},
+        "sustain_seconds": 4,
+        "clear_seconds": 10,
+        "message": "Memory pressure",
+    },
+    {
+        "name": "under_voltage",
+        "metric": "voltage.flags.under_voltage",
+        "degraded": {"enter": 1, "exit": 1},
+        "unhealthy": {"enter": 1, "exit": 1, "sustain_seconds": 30},
+        "clear_seconds": 10,
+        "message": "Supply under-voltage",
+    },
+    {
+        "name": "cpu_throttled",
+        "metric": "voltage.flags.throttled",
+        "degraded": {"enter": 1, "exit": 1},
+        "clear_seconds": 10,
+        "message": "CPU throttled",
+    },
+]
+
+
+class _Value:
+    """Latest sample, no windowing."""
+
+    def __init__(self, window_seconds: float):
+        self.current: Optional[float] = None
+
+    def update(self, t: float, v: float) -> Optional[float]:
+        self.current = v
+        return v
+
+
+class _EWMA:
+    """
+    Exponentially weighted moving average with time constant `window_seconds`.
+    Alpha is derived from the sample spacing so irregular ticks are handled.
+    """
+
+    def __init__(self, window_seconds: float):
+        self.tau = window_seconds
+        self.current: Optional[float] = None
+        self._last_t: Optional[float] = None
+
+    def update(self, t: float, v: float) -> Optional[float]:
+        if self.current is None or self.tau <= 0:
+            self.current = v
+        else:
+            alpha = 1.0 - math.exp(-max(t - self._last_t, 0.0) / self.tau)
+            self.current += alpha * (v - self.current)
+        self._last_t = t
+        return self.current
+
+
+class _SlidingExtreme:
+    """Sliding-window max (or min) over the last `window_seconds` via a monotonic deque."""
+
+    def __init__(self, window_seconds: float, use_max: bool = True):
+        self.window = window_seconds
+        self.use_max = use_max
+        self.current: Optional[float] = None
+        self._samples: Deque[Tuple[float, float]] = deque()
+
+    def update(self, t: float, v: float) -> Optional[float]:
+        samples = self._samples
+        if self.use_max:
+            while samples and samples[-1][1] <= v:
+                samples.pop()
+        else:
+            while samples and samples[-1][1] >= v:
+                samples.pop()
+        samples.append((t, v))
+        while samples[0][0] < t - self.window:
+            samples.popleft()
+        self.current = samples[0][1]
+        return self.current
+
+
+class _SlidingMin(_SlidingExtreme):
+    def __init__(self, window_seconds: float):
+        super().__init__(window_seconds, use_max=False)
+
+
+class _RateOfChange:
+    """Rate of change in units per second across the last `window_seconds`."""
+
+    def __init__(self, window_seconds: float):
+        self.window = window_seconds
+        self.current: Optional[float] = None
+        self._samples: Deque[Tuple[float, float]] = deque()
+
+    def update(self, t: float, v: float) -> Optional[float]:
+        samples = self._samples
+        samples.append((t, v))
+        # Keep one sample at or beyond the window edge as the baseline
+        while len(samples) > 2 and samples[1][0] <= t - self.window:
+            samples.popleft()
+        t0, v0 = samples[0]
+        self.current = (v - v0) / (t - t0) if t > t0 else None
+        return self.current
+
+
+_AGGREGATORS = {
+    "value": _Value,
+    "ewma": _EWMA,
+    "max": _SlidingExtreme,
+    "min": _SlidingMin,
+    "rate": _RateOfChange,
+}
+
+
+class _Latch:
+    """
+    Hysteretic latch for one severity level.
+    Raises once the enter condition has held for `sustain` seconds and
+    drops once the exit condition has held for `clear` seconds.
+    """
+
+    def __init__(self, threshold: RuleThreshold, above: bool, sustain: float, clear: float):
+        self.enter = threshold.enter
+        self.exit = threshold.enter if threshold.exit is None else threshold.exit
+        self.above = above
+        self.sustain = sustain if threshold.sustain_seconds is None else threshold.sustain_seconds
+        self.clear = clear if threshold.clear_seconds is None else threshold.clear_seconds
+        self.active = False
+        self._since: Optional[float] = None
+
+    def update(self, t: float, v: float) -> bool:
+        if not self.active:
+            pending = v >= self.enter if self.above else v <= self.enter
+            hold = self.sustain
+        else:
+            pending = v < self.exit if self.above else v > self.exit
+            hold = self.clear
+
+        if not pending:
+            self._since = None
+        else:
+            if self._since is None:
+                self._since = t
+            if t - self._since >= hold:
+                self.active = not self.active
+                self._since = None
+        return self.active
+
+
+class CompiledRule:
+    """A health rule with its metric path, aggregator and latches resolved."""
+
+    def __init__(self, rule: HealthRule):
+        self.name = rule.name
+        self.message = rule.message
+        self.path = tuple(rule.metric.split("."))
+        self.aggregator = _AGGREGATORS[rule.aggregate](rule.window_seconds)
+        self.level = HEALTHY
+        self.value: Optional[float] = None
+
+        above = rule.direction == "above"
+        self.latches: List[Tuple[str, _Latch]] = []
+        for level, threshold in ((UNHEALTHY, rule.unhealthy), (DEGRADED, rule.degraded)):
+            if threshold is None:
+                continue
+            if threshold.exit is not None and (
+                threshold.exit > threshold.enter if above else threshold.exit < threshold.enter
+            ):
+                raise ValueError(
+                    f"Rule '{rule.name}': {level} exit threshold must not be past the enter threshold"
+                )
+            self.latches.append(
+                (level, _Latch(threshold, above, rule.sustain_seconds, rule.clear_seconds))
+            )
+        if not self.latches:
+            raise ValueError(f"Rule '{rule.name}' defines no thresholds")
+
+    def extract(self, metrics: Dict[str, Any]) -> Optional[float]:
+        """Resolve the metric path, returning None when unavailable."""
+        node: Any = metrics
+        for key in self.path:
+            if not isinstance(node, dict):
+                return None
+            node = node.get(key)
+        if isinstance(node, bool):
+            return 1.0 if node else 0.0
+        if isinstance(node, (int, float)):
+            return float(node)
+        return None
+
+    def update(self, t: float, metrics: Dict[str, Any]) -> str:
+        """Fold a sample into the rule and return its current level."""
+        sample = self.extract(metrics)
+        if sample is None:
+            # Hold the previous state while the metric is unavailable
+            return self.level
+
+        self.value = self.aggregator.update(t, sample)
+        if self.value is None:
+            return self.level
+
+        level = HEALTHY
+        for name, latch in self.latches:
+            if latch.update(t, self.value) and level == HEALTHY:
+                level = name
+        self.level = level
+        return level
+
+
+class HealthRuleEngine:
+    """Evaluates a compiled rule set against a stream of metric samples."""
+
+    def __init__(self, rules: List[HealthRule]):
+        self.rules = [CompiledRule(rule) for rule in rules]
+        self.status = HEALTHY
+
+    @classmethod
+    def from_config(cls, path: Optional[str] = None) -> "HealthRuleEngine":
+        """Build an engine from a JSON rules file, or the defaults if no path is given."""
+        if path:
+            raw = json.loads(Path(path).read_text(encoding="utf-8"))
+        else:
+            raw = DEFAULT_RULES
+        return cls([HealthRule(**entry) for entry in raw])
+
+    def evaluate(
+        self, metrics: Dict[str, Any], now: Optional[float] = None
+    ) -> List[HealthTransition]:
+        """
+        Feed one sample through every rule.
+        Returns the per-rule transitions that occurred on this tick.
+        """
+        t = time.monotonic() if now is None else now
+        changed = []
+        for rule in self.rules:
+            previous = rule.level
+            if rule.update(t, metrics) != previous:
+                changed.append((rule, previous))
+
+        self.status = max(
+            (rule.level for rule in self.rules), key=LEVELS.index, default=HEALTHY
+        )
+
+        timestamp = time.time()
+        return [
+            HealthTransition(
+                rule=rule.name,
+                previous=previous,
+                current=rule.level,
+                value=rule.value,
+                overall=self.status,
+                message=rule.message,
+                timestamp=timestamp,
+            )
+            for rule, previous in changed
+        ]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current per-rule state for inclusion in metric payloads."""
+        return {
+            rule.name: {"level": rule.level, "value": rule.value}
+            for rule in self.rules
+        }
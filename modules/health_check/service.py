@@ -3,55 +3,117 @@ Health Check Module Service
 This module can be extended independently for health check functionality.
 """
 
-from typing import Dict, Any
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional, Set, Tuple
+from baja_testbench.core.config import settings
 from baja_testbench.services.system_metrics import SystemMetricsService
+from modules.health_check.models import HealthTransition
+from modules.health_check.rules import HealthRuleEngine
+
+
+class HealthSubscription:
+    """
+    Per-client mailbox.
+    Holds at most `max_metrics` metric payloads, dropping the oldest when a
+    slow client falls behind. Transition events are never dropped.
+    """
+
+    def __init__(self, max_metrics: int):
+        self.max_metrics = max_metrics
+        self._messages: Deque[Tuple[bool, Dict[str, Any]]] = deque()
+        self._metrics = 0
+        self._ready = asyncio.Event()
+
+    def put(self, message: Dict[str, Any], is_event: bool = False) -> None:
+        if not is_event:
+            if self._metrics >= self.max_metrics:
+                for index, (queued_event, _) in enumerate(self._messages):
+                    if not queued_event:
+                        del self._messages[index]
+                        self._metrics -= 1
+                        break
+            self._metrics += 1
+        self._messages.append((is_event, message))
+        self._ready.set()
+
+    async def get(self) -> Dict[str, Any]:
+        while not self._messages:
+            self._ready.clear()
+            await self._ready.wait()
+        is_event, message = self._messages.popleft()
+        if not is_event:
+            self._metrics -= 1
+        return message
 
 
 class HealthCheckModule:
     """
     Health check module service.
     Wraps system metrics service for module-specific functionality.
+    Health is judged by a streaming rule engine fed on every sampler tick;
+    rule transitions are pushed to subscribers as events.
     """
-    
-    def __init__(self):
+
+    def __init__(self, engine: Optional[HealthRuleEngine] = None):
         self.metrics_service = SystemMetricsService()
-    
+        self.engine = engine or HealthRuleEngine.from_config(settings.health_rules_path)
+        self.latest: Optional[Dict[str, Any]] = None
+        self._subscribers: Set[HealthSubscription] = set()
+
     def get_health_status(self) -> Dict[str, Any]:
         """
-        Get comprehensive health status.
-        Can be extended with module-specific health checks.
+        Get the metrics and health status from the latest sampler tick.
+        Before the first tick, takes a fresh sample without feeding it to
+        the rule engine so sampler-driven windows and timers are unaffected.
         """
-        metrics = self.metrics_service.get_all_metrics()
-        
-        # Add module-specific health assessment
-        health_status = self._assess_health(metrics)
-        
+        if self.latest is not None:
+            return self.latest
         return {
-            **metrics,
-            "health_status": health_status
+            **self.metrics_service.get_all_metrics(),
+            "health_status": self.engine.status,
+            "health_rules": self.engine.snapshot(),
         }
-    
-    def _assess_health(self, metrics: Dict[str, Any]) -> str:
+
+    def _assess_health(self, metrics: Dict[str, Any]) -> List[HealthTransition]:
         """
-        Assess overall health based on metrics.
-        Returns: 'healthy', 'degraded', or 'unhealthy'
+        Feed one metrics sample through the rule engine.
+        Returns the rule transitions produced by this sample.
         """
-        # Simple health assessment logic
-        cpu_usage = metrics.get("cpu", {}).get("usage_percent", 0)
-        memory_percent = metrics.get("memory", {}).get("percent", 0)
-        temp = metrics.get("temperature", {}).get("celsius")
-        voltage_status = metrics.get("voltage", {}).get("status", "N/A")
-        
-        # Check for critical issues
-        if voltage_status == "WARNING":
-            return "degraded"
-        
-        if temp and temp > 80:  # High temperature threshold
-            return "degraded"
-        
-        if cpu_usage > 95 or memory_percent > 95:
-            return "degraded"
-        
-        return "healthy"
+        transitions = self.engine.evaluate(metrics)
+        self.latest = {
+            **metrics,
+            "health_status": self.engine.status,
+            "health_rules": self.engine.snapshot(),
+        }
+        return transitions
 
+    def subscribe(self) -> HealthSubscription:
+        """Register a client mailbox for metric payloads and health events."""
+        subscription = HealthSubscription(settings.health_subscriber_queue_size)
+        self._subscribers.add(subscription)
+        return subscription
 
+    def unsubscribe(self, subscription: HealthSubscription) -> None:
+        """Remove a client mailbox registered with subscribe()."""
+        self._subscribers.discard(subscription)
+
+    def _publish(self, message: Dict[str, Any], is_event: bool = False) -> None:
+        for subscription in self._subscribers:
+            subscription.put(message, is_event)
+
+    async def run_sampler(self, interval: float) -> None:
+        """
+        Sample metrics every `interval` seconds, evaluate the rules and
+        broadcast the results. Runs until cancelled.
+        """
+        while True:
+            try:
+                metrics = await asyncio.to_thread(self.metrics_service.get_all_metrics)
+                transitions = self._assess_health(metrics)
+                for transition in transitions:
+                    self._publish(transition.model_dump(), is_event=True)
+                self._publish(self.latest)
+            except Exception as e:
+                print(f"Health sampler error: {e}")
+            await asyncio.sleep(interval)
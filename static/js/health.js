@@ -28,7 +28,11 @@ class HealthMonitor {
             this.ws.onmessage = (event) => {
                 try {
                     const data = JSON.parse(event.data);
-                    this.updateHealthDisplay(data);
+                    if (data.type === 'health_event') {
+                        this.handleHealthEvent(data);
+                    } else {
+                        this.updateHealthDisplay(data);
+                    }
                 } catch (error) {
                     console.error('Error parsing WebSocket message:', error);
                 }
@@ -313,37 +317,24 @@ class HealthMonitor {
     }
 
     updateHealthStatus(data) {
+        // Overall status comes from the server's health rule engine
+        this.setHealthStatus(data.health_status);
+    }
+
+    setHealthStatus(status) {
         const statusDot = document.getElementById('health-status-dot');
         const statusText = document.getElementById('health-status-text');
-        
-        let status = 'healthy';
-        let statusClass = 'healthy';
-        
-        // Determine overall health
-        if (data.voltage && data.voltage.status === 'WARNING') {
-            status = 'degraded';
-            statusClass = 'degraded';
-        }
-        
-        if (data.temperature && data.temperature.celsius > 80) {
-            status = 'degraded';
-            statusClass = 'degraded';
-        }
-        
-        if (data.cpu && data.cpu.usage_percent > 95) {
-            status = 'degraded';
-            statusClass = 'degraded';
-        }
-        
-        if (data.memory && data.memory.percent > 95) {
-            status = 'degraded';
-            statusClass = 'degraded';
-        }
-
-        statusDot.className = `status-dot ${statusClass}`;
+        statusDot.className = `status-dot ${status}`;
         statusText.textContent = status.charAt(0).toUpperCase() + status.slice(1);
     }
 
+    handleHealthEvent(event) {
+        // Rule state transition pushed by the server
+        console.log(`Health rule '${event.rule}': ${event.previous} -> ${event.current}` +
+            (event.message ? ` (${event.message})` : ''));
+        this.setHealthStatus(event.overall);
+    }
+
     showError() {
         document.getElementById('health-status-text').textContent = 'Error';
         document.getElementById('health-status-dot').className = 'status-dot unhealthy';
@@ -0,0 +1,84 @@
+"""
+Tests for the diagnostics API endpoints.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from baja_testbench.core.config import settings
+from baja_testbench.main import app
+from baja_testbench.services.profiler import SamplingProfiler
+
+PROFILE_URL = f"{settings.api_v1_prefix}/diagnostics/profile"
+TOKEN = "test-token"
+
+
+@pytest.fixture
+def client():
+    # No context manager: the health sampler lifespan is not needed here
+    return TestClient(app)
+
+
+@pytest.fixture
+def token(monkeypatch):
+    monkeypatch.setattr(settings, "diagnostics_token", TOKEN)
+    return TOKEN
+
+
+def test_profile_disabled_without_configured_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "diagnostics_token", None)
+
+    response = client.get(PROFILE_URL, headers={"Authorization": f"Bearer {TOKEN}"})
+
+    assert response.status_code == 403
+
+
+def test_profile_rejects_missing_token(client, token):
+    response = client.get(PROFILE_URL, params={"seconds": 0.1})
+
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+
+
+def test_profile_rejects_wrong_token(client, token):
+    response = client.get(
+        PROFILE_URL, params={"seconds": 0.1}, headers={"Authorization": "Bearer nope"}
+    )
+
+    assert response.status_code == 401
+
+
+def test_profile_busy_returns_conflict(client, token):
+    assert SamplingProfiler._lock.acquire(blocking=False)
+    try:
+        response = client.get(
+            PROFILE_URL, params={"seconds": 0.1}, headers={"Authorization": f"Bearer {token}"}
+        )
+    finally:
+        SamplingProfiler._lock.release()
+
+    assert response.status_code == 409
+
+
+def test_profile_rejects_rate_above_maximum(client, token):
+    response = client.get(
+        PROFILE_URL,
+        params={"seconds": 0.1, "hz": settings.profiler_max_hz + 1},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 422
+
+
+def test_profile_returns_collapsed_stacks(client, token):
+    response = client.get(
+        PROFILE_URL, params={"seconds": 0.2}, headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert int(response.headers["X-Profile-Samples"]) > 0
+    for line in response.text.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert ";" in stack
+        assert int(count) > 0
@@ -0,0 +1,182 @@
+"""
+Tests for the streaming health rule engine.
+"""
+
+import pytest
+
+from modules.health_check.models import HealthRule
+from modules.health_check.rules import CompiledRule, HealthRuleEngine
+
+
+def _engine(**rule):
+    rule.setdefault("name", "probe")
+    rule.setdefault("metric", "probe.value")
+    return HealthRuleEngine([HealthRule(**rule)])
+
+
+def _feed(engine, samples, start=0.0, step=1.0):
+    """Feed values at fixed spacing; return the overall status after each."""
+    statuses = []
+    for i, value in enumerate(samples):
+        engine.evaluate({"probe": {"value": value}}, now=start + i * step)
+        statuses.append(engine.status)
+    return statuses
+
+
+def _aggregate(rule, samples):
+    """Feed values at t=0, 1, 2, ...; return the aggregate after each."""
+    values = []
+    for t, value in enumerate(samples):
+        rule.update(t, {"v": value})
+        values.append(rule.value)
+    return values
+
+
+def test_latch_enters_and_exits_with_hysteresis_band():
+    engine = _engine(degraded={"enter": 80, "exit": 70})
+
+    statuses = _feed(engine, [79, 80, 75, 71, 70, 69, 75])
+
+    assert statuses == [
+        "healthy",
+        "degraded",  # reached enter threshold
+        "degraded",  # inside the band, stays latched
+        "degraded",
+        "degraded",  # exit requires dropping below 70
+        "healthy",
+        "healthy",  # inside the band, stays clear
+    ]
+
+
+def test_direction_below():
+    engine = _engine(direction="below", degraded={"enter": 10, "exit": 20})
+
+    assert _feed(engine, [15, 10, 19, 21]) == ["healthy", "degraded", "degraded", "healthy"]
+
+
+def test_sustain_and_clear_timing():
+    engine = _engine(degraded={"enter": 80, "exit": 70}, sustain_seconds=3, clear_seconds=2)
+
+    statuses = _feed(engine, [90, 90, 90, 90, 50, 50, 50])
+
+    # Raised once the condition has held for 3s (t=0..3), cleared after 2s (t=4..6)
+    assert statuses == ["healthy", "healthy", "healthy", "degraded", "degraded", "degraded", "healthy"]
+
+
+def test_sustain_timer_resets_when_condition_breaks():
+    engine = _engine(degraded={"enter": 80}, sustain_seconds=2)
+
+    assert _feed(engine, [90, 90, 50, 90, 90, 90]) == [
+        "healthy", "healthy", "healthy", "healthy", "healthy", "degraded",
+    ]
+
+
+def test_per_level_sustain_override():
+    engine = _engine(
+        degraded={"enter": 1},
+        unhealthy={"enter": 1, "sustain_seconds": 5},
+    )
+
+    statuses = _feed(engine, [1] * 7)
+
+    assert statuses == ["degraded"] * 5 + ["unhealthy"] * 2
+
+
+def test_transitions_reported_once_per_change():
+    engine = _engine(degraded={"enter": 80, "exit": 70})
+
+    first = engine.evaluate({"probe": {"value": 90}}, now=0)
+    repeat = engine.evaluate({"probe": {"value": 90}}, now=1)
+    cleared = engine.evaluate({"probe": {"value": 60}}, now=2)
+
+    assert [(t.previous, t.current, t.overall) for t in first] == [("healthy", "degraded", "degraded")]
+    assert repeat == []
+    assert [(t.previous, t.current) for t in cleared] == [("degraded", "healthy")]
+
+
+def test_missing_metric_holds_state():
+    engine = _engine(degraded={"enter": 80})
+    engine.evaluate({"probe": {"value": 90}}, now=0)
+
+    assert engine.evaluate({"probe": {"value": None}}, now=1) == []
+    assert engine.evaluate({}, now=2) == []
+    assert engine.status == "degraded"
+
+
+def test_bool_metric_is_coerced():
+    engine = _engine(degraded={"enter": 1})
+
+    assert _feed(engine, [False, True, False]) == ["healthy", "degraded", "healthy"]
+
+
+def test_sliding_max_evicts_expired_samples():
+    rule = CompiledRule(HealthRule(
+        name="probe", metric="v", aggregate="max", window_seconds=3,
+        degraded={"enter": 100},
+    ))
+
+    # 9 at t=1 covers t=1..4, then falls out of the window
+    assert _aggregate(rule, [5, 9, 2, 1, 1, 3]) == [5, 9, 9, 9, 9, 3]
+
+
+def test_sliding_min_evicts_expired_samples():
+    rule = CompiledRule(HealthRule(
+        name="probe", metric="v", aggregate="min", window_seconds=2,
+        direction="below", degraded={"enter": -100},
+    ))
+
+    assert _aggregate(rule, [5, 1, 4, 6, 7]) == [5, 1, 1, 1, 4]
+
+
+def test_rate_is_none_on_first_sample_then_per_second():
+    rule = CompiledRule(HealthRule(
+        name="probe", metric="v", aggregate="rate", window_seconds=4,
+        degraded={"enter": 100},
+    ))
+
+    rule.update(0, {"v": 10})
+    assert rule.value is None
+
+    rule.update(2, {"v": 14})
+    assert rule.value == pytest.approx(2.0)
+
+    # Baseline slides forward once older samples leave the window
+    rule.update(4, {"v": 14})
+    rule.update(6, {"v": 14})
+    rule.update(8, {"v": 14})
+    assert rule.value == pytest.approx(0.0)
+
+
+def test_ewma_tracks_towards_sample():
+    rule = CompiledRule(HealthRule(
+        name="probe", metric="v", aggregate="ewma", window_seconds=10,
+        degraded={"enter": 100},
+    ))
+
+    rule.update(0, {"v": 0})
+    rule.update(10, {"v": 100})
+
+    # One time constant closes ~63% of the gap
+    assert rule.value == pytest.approx(63.2, abs=0.1)
+
+
+def test_exit_past_enter_is_rejected():
+    with pytest.raises(ValueError, match="exit threshold"):
+        CompiledRule(HealthRule(name="probe", metric="v", degraded={"enter": 80, "exit": 90}))
+
+    with pytest.raises(ValueError, match="exit threshold"):
+        CompiledRule(HealthRule(
+            name="probe", metric="v", direction="below", degraded={"enter": 10, "exit": 5},
+        ))
+
+
+def test_rule_without_thresholds_is_rejected():
+    with pytest.raises(ValueError, match="no thresholds"):
+        CompiledRule(HealthRule(name="probe", metric="v"))
+
+
+def test_default_rules_compile():
+    engine = HealthRuleEngine.from_config()
+
+    assert engine.status == "healthy"
+    assert {rule.name for rule in engine.rules} >= {"cpu_temperature", "under_voltage"}
@@ -0,0 +1,109 @@
+"""
+Tests for the health check module service and /health endpoint.
+"""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from baja_testbench.core.config import settings
+from baja_testbench.main import app
+from baja_testbench.services.system_metrics import SystemMetricsService
+from modules.health_check.models import HealthRule
+from modules.health_check.rules import HealthRuleEngine
+from modules.health_check.service import HealthCheckModule, HealthSubscription
+
+
+def _module():
+    engine = HealthRuleEngine([HealthRule(
+        name="probe", metric="probe.value", aggregate="ewma", window_seconds=10,
+        degraded={"enter": 80, "exit": 70},
+    )])
+    return HealthCheckModule(engine=engine)
+
+
+def test_subscription_drops_oldest_metrics_and_keeps_events():
+    subscription = HealthSubscription(max_metrics=2)
+
+    subscription.put({"n": 1})
+    subscription.put({"type": "health_event", "n": "e"}, is_event=True)
+    subscription.put({"n": 2})
+    subscription.put({"n": 3})
+    subscription.put({"n": 4})
+
+    assert subscription._metrics == 2
+
+    async def drain():
+        return [await subscription.get() for _ in range(3)]
+
+    assert [m["n"] for m in asyncio.run(drain())] == ["e", 3, 4]
+    assert subscription._metrics == 0
+
+
+def test_sampler_publishes_events_before_metrics(monkeypatch):
+    module = _module()
+    monkeypatch.setattr(
+        module.metrics_service, "get_all_metrics", lambda: {"probe": {"value": 90}}
+    )
+
+    async def one_tick():
+        subscription = module.subscribe()
+        sampler = asyncio.create_task(module.run_sampler(interval=60))
+        try:
+            first = await asyncio.wait_for(subscription.get(), timeout=5)
+            second = await asyncio.wait_for(subscription.get(), timeout=5)
+        finally:
+            sampler.cancel()
+            module.unsubscribe(subscription)
+        return first, second
+
+    event, metrics = asyncio.run(one_tick())
+
+    assert event["type"] == "health_event"
+    assert (event["rule"], event["previous"], event["current"]) == ("probe", "healthy", "degraded")
+    assert metrics["health_status"] == "degraded"
+    assert metrics["probe"] == {"value": 90}
+    assert module._subscribers == set()
+
+
+def test_get_health_status_before_first_tick_leaves_engine_untouched(monkeypatch):
+    module = _module()
+    monkeypatch.setattr(
+        module.metrics_service, "get_all_metrics", lambda: {"probe": {"value": 90}}
+    )
+
+    status = module.get_health_status()
+
+    assert status["health_status"] == "healthy"
+    assert module.latest is None
+    assert module.engine.rules[0].value is None
+    assert module.engine.rules[0].aggregator.current is None
+
+
+def test_get_health_status_returns_latest_tick(monkeypatch):
+    module = _module()
+    module._assess_health({"probe": {"value": 90}})
+    latest = module.latest
+
+    def unexpected_sample():
+        raise AssertionError("should not sample once a tick exists")
+
+    monkeypatch.setattr(module.metrics_service, "get_all_metrics", unexpected_sample)
+
+    assert module.get_health_status() is latest
+    assert latest["health_status"] == "degraded"
+
+
+def test_health_endpoint_serves_latest_tick(monkeypatch):
+    # No context manager, so the background sampler does not overwrite `latest`
+    client = TestClient(app)
+    metrics = SystemMetricsService.get_all_metrics()
+    latest = {**metrics, "health_status": "unhealthy", "health_rules": {}}
+    monkeypatch.setattr(app.state.health_module, "latest", latest)
+
+    response = client.get(f"{settings.api_v1_prefix}/health")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["health_status"] == "unhealthy"
+    assert body["memory"]["used_bytes"] == metrics["memory"]["used_bytes"]
@@ -0,0 +1,50 @@
+"""
+Tests for the sampling profiler service.
+"""
+
+import threading
+
+import pytest
+from pydantic import ValidationError
+
+from baja_testbench.core.config import Settings
+from baja_testbench.services.profiler import SamplingProfiler
+
+
+def test_profile_collects_named_thread_stacks():
+    stop = threading.Event()
+    worker = threading.Thread(target=stop.wait, name="probe-worker")
+    worker.start()
+    try:
+        collapsed, stats = SamplingProfiler().profile(0.2, 50)
+    finally:
+        stop.set()
+        worker.join()
+
+    assert stats["samples"] > 0
+    assert any(line.startswith("probe-worker;") for line in collapsed.splitlines())
+
+
+def test_profile_does_not_overrun_deadline_when_budget_stretches_interval():
+    # A tiny budget pushes the next tick far beyond the deadline after one sample
+    _, stats = SamplingProfiler().profile(0.2, 50, max_overhead_percent=0.0001)
+
+    assert stats["samples"] == 1
+    assert stats["duration_seconds"] < 0.3
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"seconds": 0, "hz": 50},
+    {"seconds": 1, "hz": 0},
+    {"seconds": 1, "hz": 50, "max_overhead_percent": 0},
+    {"seconds": 1, "hz": 50, "max_overhead_percent": -1},
+])
+def test_profile_rejects_non_positive_arguments(kwargs):
+    with pytest.raises(ValueError):
+        SamplingProfiler().profile(**kwargs)
+
+
+@pytest.mark.parametrize("value", [0, -1])
+def test_settings_reject_non_positive_overhead_budget(value):
+    with pytest.raises(ValidationError):
+        Settings(profiler_max_overhead_percent=value)